@@ -1,8 +1,7 @@
+import time
 import streamlit as st
 import requests
-import json
-import pandas as pd
-from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 # Configuration
 st.set_page_config(
@@ -13,6 +12,8 @@ st.set_page_config(
 )
 
 BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = 5
+ANALYZE_TIMEOUT = 60
 
 # Styling
 st.markdown("""
@@ -44,15 +45,73 @@ def get_status_color(score):
     if score < 70: return "medium-risk"
     return "high-risk"
 
+@st.cache_resource
+def get_adapter():
+    # Keep-alive connection pool shared by every browser session in this server process
+    return HTTPAdapter(pool_connections=1, pool_maxsize=10)
+
+def get_session():
+    # Lightweight Session per browser session on top of the shared pool,
+    # so cookies and other Session state never leak between operators
+    if "http_session" not in st.session_state:
+        session = requests.Session()
+        session.mount("http://", get_adapter())
+        session.mount("https://", get_adapter())
+        st.session_state.http_session = session
+    return st.session_state.http_session
+
+@st.cache_resource
+def _warm_up_connection():
+    # Raises on failure so that only a successful warm-up is cached for the process
+    start = time.perf_counter()
+    get_session().get(f"{BASE_URL}/health", timeout=(1, 2)).raise_for_status()
+    return (time.perf_counter() - start) * 1000
+
+@st.cache_data(ttl=30)
+def warm_up_connection():
+    """Open the pooled connection once. Returns the setup time in ms, or None if it failed.
+
+    A failure is cached for 30 seconds so a down backend does not block every rerun.
+    """
+    try:
+        return _warm_up_connection()
+    except requests.RequestException:
+        return None
+
+def connection_stats():
+    """Connections opened vs requests sent on the shared pool, or None if unavailable.
+
+    Reads urllib3 pool counters, which are not public API, so any change there
+    degrades to None instead of breaking the page.
+    """
+    try:
+        pools = get_adapter().poolmanager.pools
+        opened = sent = 0
+        for key in pools.keys():
+            pool = pools[key]
+            opened += pool.num_connections
+            sent += pool.num_requests
+    except (AttributeError, KeyError, TypeError):
+        return None
+    return {"opened": opened, "requests": sent, "reused": max(sent - opened, 0)}
+
+# Warm the shared connection before any page makes its first call
+warm_up_ms = warm_up_connection()
+
+@st.cache_data(ttl=5)
+def fetch_stats():
+    resp = get_session().get(f"{BASE_URL}/api/v1/admin/stats", timeout=REQUEST_TIMEOUT)
+    if resp.status_code != 200:
+        return None
+    return resp.json()
+
 if page == "Dashboard":
     st.title("security Overview")
     
     # Fetch Stats
     try:
-        resp = requests.get(f"{BASE_URL}/api/v1/admin/stats")
-        if resp.status_code == 200:
-            stats = resp.json()
-            
+        stats = fetch_stats()
+        if stats is not None:
             c1, c2, c3 = st.columns(3)
             with c1:
                 st.metric("Total Scans", stats.get("total_analyses", 0))
@@ -98,7 +157,9 @@ elif page == "Threat Analysis":
                 }
                 
                 # Make Request
-                response = requests.post(f"{BASE_URL}/api/v1/analyze/complete", data=payload)
+                response = get_session().post(
+                    f"{BASE_URL}/api/v1/analyze/complete", data=payload, timeout=ANALYZE_TIMEOUT
+                )
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -153,9 +214,21 @@ elif page == "Threat Analysis":
 
 elif page == "System Health":
     st.title("System Health")
+    if warm_up_ms is None:
+        st.caption("Connection warm-up: failed (retried within 30 s)")
+    else:
+        st.caption(f"Connection warm-up: {warm_up_ms:.0f} ms")
+    conn = connection_stats()
+    if conn is None:
+        st.caption("Connection reuse: unavailable")
+    else:
+        st.caption(
+            f"Connections opened: {conn['opened']} · Requests sent: {conn['requests']} · "
+            f"Reused: {conn['reused']}"
+        )
     if st.button("Check Connectivity"):
         try:
-            r = requests.get(f"{BASE_URL}/health")
+            r = get_session().get(f"{BASE_URL}/health", timeout=REQUEST_TIMEOUT)
             st.success(f"Status: {r.status_code}")
             st.json(r.json())
         except Exception as e: